@@ -12,42 +12,762 @@ This is the main Flask application file that provides:
 # ========================================
 # Import Required Libraries
 # ========================================
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, make_response, g, abort
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS  # For handling Cross-Origin requests
+from flask_compress import Compress  # gzip/brotli response compression
+from flask_limiter import Limiter  # Per-client request rate limits
+from flask_limiter.util import get_remote_address
+from werkzeug.exceptions import HTTPException
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.security import check_password_hash, safe_join
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlsplit
+import orjson  # Fast JSON serializer for API responses
+import atexit
+import base64
+import gzip
+import hashlib
+import logging
+import mimetypes
+import queue
 import sqlite3
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 
 # ========================================
 # Initialize Flask Application
 # ========================================
-app = Flask(__name__, static_folder='.')  # Serve static files from current directory
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson, so request.get_json() and jsonify()
+    both skip the pure-Python parts of the json module. Types orjson
+    does not know (Decimal, UUID, ...) fall back to Flask's default().
+
+    Keys keep their insertion order (sort_keys = False); set sort_keys
+    to True, or pass sort_keys/indent to dumps(), as with the default
+    provider (orjson only indents by 2 spaces).
+    """
+    sort_keys = False
+
+    def _encode(self, obj, sort_keys=None, indent=None):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, kwargs.get('sort_keys'), kwargs.get('indent')).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Like DefaultJSONProvider.response(), writing orjson's bytes
+        straight into the response body."""
+        if args and kwargs:
+            raise TypeError('app.json.response() takes either args or kwargs, not both')
+        if kwargs:
+            obj = kwargs
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args) or None
+
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = self._encode(obj, indent=indent)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+# Static files are served by serve_static() below (or by nginx, see
+# nginx.conf), so Flask's built-in static route is disabled
+app = Flask(__name__, static_folder=None)
+app.json = OrjsonProvider(app)  # jsonify() and request.get_json() use orjson
 CORS(app)  # Enable CORS for all routes (allows frontend to connect)
 
+# Compress responses of 500 bytes or more
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_LEVEL'] = 6
+Compress(app)
+
+# Trust the X-Forwarded-For set by the hosting proxy so rate limits
+# apply to the real client address instead of the proxy's. Only safe
+# while the server is reachable through that proxy alone (behind nginx,
+# run gunicorn with HOST=127.0.0.1, see gunicorn.conf.py)
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1)
+
+# Rate limiter. The default memory:// storage counts per process, so
+# with N gunicorn workers a client effectively gets N times each limit;
+# multi-worker deployments should share counters through Redis, e.g.
+# RATELIMIT_STORAGE_URI=redis://localhost:6379 (needs `pip install redis`)
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    storage_uri=os.environ.get('RATELIMIT_STORAGE_URI', 'memory://')
+)
+
+# Log to stderr; LOGLEVEL=WARNING silences the startup messages
+logging.basicConfig(
+    level=os.environ.get('LOGLEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger('aids')
+
 # Database file path
 DATABASE = 'department.db'
 
+# Seconds a connection waits for another writer's lock before raising
+# "database is locked"
+DB_BUSY_TIMEOUT = 5
+
+# Cache-Control for successful GET responses, by endpoint. Browsers may
+# reuse public data for a minute and shared caches (CDN/proxy) for five;
+# contact messages are private and never stored
+CACHE_CONTROL = {
+    'get_faculty': 'public, max-age=60, s-maxage=300',
+    'get_faculty_by_id': 'public, max-age=60, s-maxage=300',
+    'get_achievements': 'public, max-age=60, s-maxage=300',
+    'get_gallery': 'public, max-age=60, s-maxage=300',
+    'get_contacts': 'private, no-store',
+    'get_contact_stats': 'private, no-store',
+}
+
+# Pool of idle database connections, reused across requests. Size it
+# to the number of request threads per process (see asgi.py)
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+_pool_pid = os.getpid()
+
+# Cached GET responses, least recently used first:
+# (path, query string, table versions) -> (stored at, JSON body,
+# gzipped body or None, ETag)
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_TTL = 60  # seconds
+_CACHE_MAX_ENTRIES = 256
+
+# Contact form submissions waiting to be written by the background writer
+_contact_queue = queue.Queue()
+_contact_writer_thread = None
+_contact_writer_lock = threading.Lock()
+_CONTACT_BATCH_SIZE = 64
+
+# Page size limits for GET /api/contact
+CONTACT_PAGE_SIZE = 50
+CONTACT_MAX_PAGE_SIZE = 500
+CONTACT_MAX_PAGE = 1000000  # Keeps page * size within SQLite's 64-bit OFFSET
+
+# Page size limits for ?limit= on GET /api/achievements and /api/gallery
+LIST_PAGE_SIZE = 20
+LIST_MAX_PAGE_SIZE = 100
+
+# Keyset of the first page: sorts after every stored created_at
+_FIRST_PAGE_KEY = ('9999-12-31 23:59:59', 0)
+
+# ========================================
+# SQL Statements
+# ========================================
+# Defined once so every request passes the same string to the
+# connection, which lets sqlite3's statement cache reuse the
+# compiled statement instead of re-preparing it (the default cache
+# holds 128 statements per connection, well above the ones below)
+
+# Contact Messages
+SQL_INSERT_CONTACT = '''
+    INSERT INTO contact_messages
+    (first_name, last_name, email, phone, subject, message, newsletter)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_SELECT_CONTACTS = '''
+    SELECT id, first_name AS firstName, last_name AS lastName, email,
+           phone, subject, message, newsletter, created_at AS createdAt
+    FROM contact_messages ORDER BY created_at DESC, id DESC
+    LIMIT ? OFFSET ?
+'''
+SQL_CONTACT_STATS = '''
+    SELECT COUNT(*) AS total,
+           COALESCE(SUM(created_at >= ?), 0) AS today,
+           COALESCE(SUM(subject = 'admission'), 0) AS admission
+    FROM contact_messages
+'''
+
+# Faculty
+SQL_SELECT_FACULTY = '''
+    SELECT id, name, designation, subject, bio, email, is_hod AS isHod
+    FROM faculty ORDER BY is_hod DESC, name ASC
+'''
+SQL_SELECT_FACULTY_BY_ID = '''
+    SELECT id, name, designation, subject, bio, email, is_hod AS isHod
+    FROM faculty WHERE id = ?
+'''
+SQL_INSERT_FACULTY = '''
+    INSERT INTO faculty (name, designation, subject, bio, email, is_hod)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_FACULTY = '''
+    UPDATE faculty SET
+        name = ?, designation = ?, subject = ?, bio = ?, email = ?, is_hod = ?
+    WHERE id = ?
+'''
+SQL_DELETE_FACULTY = 'DELETE FROM faculty WHERE id = ?'
+
+# Achievements
+SQL_SELECT_ALL_ACHIEVEMENTS = '''
+    SELECT id, icon, title, description, category,
+           is_active AS isActive, created_at AS createdAt
+    FROM achievements
+    ORDER BY created_at DESC, id ASC
+'''
+SQL_SELECT_ACTIVE_ACHIEVEMENTS = '''
+    SELECT id, icon, title, description, category,
+           is_active AS isActive, created_at AS createdAt
+    FROM achievements
+    WHERE is_active = 1 ORDER BY created_at DESC, id ASC
+'''
+# One page after the (created_at, id) key of the previous page's last row
+SQL_SELECT_ALL_ACHIEVEMENTS_PAGE = '''
+    SELECT id, icon, title, description, category,
+           is_active AS isActive, created_at AS createdAt
+    FROM achievements
+    WHERE created_at <= ? AND (created_at < ? OR id > ?)
+    ORDER BY created_at DESC, id ASC LIMIT ?
+'''
+SQL_SELECT_ACTIVE_ACHIEVEMENTS_PAGE = '''
+    SELECT id, icon, title, description, category,
+           is_active AS isActive, created_at AS createdAt
+    FROM achievements
+    WHERE is_active = 1 AND created_at <= ? AND (created_at < ? OR id > ?)
+    ORDER BY created_at DESC, id ASC LIMIT ?
+'''
+SQL_INSERT_ACHIEVEMENT = '''
+    INSERT INTO achievements (icon, title, description, category, is_active)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_ACHIEVEMENT = '''
+    UPDATE achievements SET
+        icon = ?, title = ?, description = ?, category = ?, is_active = ?
+    WHERE id = ?
+'''
+SQL_DELETE_ACHIEVEMENT = 'DELETE FROM achievements WHERE id = ?'
+
+# Gallery
+SQL_SELECT_ALL_GALLERY = '''
+    SELECT id, image_url AS imageUrl, caption, event_date AS eventDate,
+           is_active AS isActive, created_at AS createdAt
+    FROM gallery
+    ORDER BY created_at DESC, id ASC
+'''
+SQL_SELECT_ACTIVE_GALLERY = '''
+    SELECT id, image_url AS imageUrl, caption, event_date AS eventDate,
+           is_active AS isActive, created_at AS createdAt
+    FROM gallery
+    WHERE is_active = 1 ORDER BY created_at DESC, id ASC
+'''
+SQL_SELECT_ALL_GALLERY_PAGE = '''
+    SELECT id, image_url AS imageUrl, caption, event_date AS eventDate,
+           is_active AS isActive, created_at AS createdAt
+    FROM gallery
+    WHERE created_at <= ? AND (created_at < ? OR id > ?)
+    ORDER BY created_at DESC, id ASC LIMIT ?
+'''
+SQL_SELECT_ACTIVE_GALLERY_PAGE = '''
+    SELECT id, image_url AS imageUrl, caption, event_date AS eventDate,
+           is_active AS isActive, created_at AS createdAt
+    FROM gallery
+    WHERE is_active = 1 AND created_at <= ? AND (created_at < ? OR id > ?)
+    ORDER BY created_at DESC, id ASC LIMIT ?
+'''
+SQL_INSERT_GALLERY = '''
+    INSERT INTO gallery (image_url, caption, event_date, is_active)
+    VALUES (?, ?, ?, ?)
+'''
+SQL_UPDATE_GALLERY = '''
+    UPDATE gallery SET
+        image_url = ?, caption = ?, event_date = ?, is_active = ?
+    WHERE id = ?
+'''
+SQL_DELETE_GALLERY = 'DELETE FROM gallery WHERE id = ?'
+
+# Table versions (bumped by triggers, see init_db)
+SQL_SELECT_TABLE_VERSIONS = 'SELECT name, version FROM table_versions'
+
 # ========================================
 # Database Helper Functions
 # ========================================
 
-def get_db_connection():
+def _connect():
     """
-    Create and return a database connection.
+    Open a new database connection.
     Uses Row factory to return rows as dictionaries.
     """
-    conn = sqlite3.connect(DATABASE)
+    # Pooled connections move between threads, but only one request
+    # uses a connection at a time
+    conn = sqlite3.connect(
+        DATABASE,
+        timeout=DB_BUSY_TIMEOUT,
+        check_same_thread=False
+    )
     conn.row_factory = sqlite3.Row  # This makes rows accessible by column name
+
+    # Per-connection settings (WAL mode itself is persistent and set
+    # once in init_db): NORMAL sync is safe under WAL, and the
+    # cache/mmap settings keep hot pages in memory
+    conn.executescript('''
+        PRAGMA synchronous = NORMAL;
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA temp_store = MEMORY;
+    ''')
     return conn
 
 
+def get_db_connection():
+    """
+    Return the database connection for the current request.
+    The first call in a request takes an idle connection from the pool
+    (or opens a new one); it goes back to the pool when the request
+    ends, so handlers must not close it.
+    """
+    global _pool, _pool_pid
+    if 'db' not in g:
+        # Start a fresh pool after a fork (e.g. gunicorn workers),
+        # SQLite handles must never be shared between processes
+        if _pool_pid != os.getpid():
+            _pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+            _pool_pid = os.getpid()
+        try:
+            g.db = _pool.get_nowait()
+        except queue.Empty:
+            g.db = _connect()
+    return g.db
+
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """
+    Return the request's connection to the pool, rolling back any
+    transaction a failed request left open. Connections beyond
+    DB_POOL_SIZE are closed.
+    """
+    conn = g.pop('db', None)
+    if conn is None:
+        return
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+# ========================================
+# Response Cache Helpers
+# ========================================
+
+def cached_response(*tables):
+    """
+    Cache the JSON body of a GET endpoint for _CACHE_TTL seconds.
+    Only successful responses are cached, and at most
+    _CACHE_MAX_ENTRIES are kept (least recently used are dropped).
+
+    The key includes the current version of each table the endpoint
+    reads. Versions live in the table_versions table and are bumped by
+    triggers in the same transaction as the write, so every worker
+    process sees a change as soon as it commits, and a write to one
+    table (or a contact message) leaves the other endpoints cached.
+
+    Responses carry an ETag of the body; a client sending a matching
+    If-None-Match header gets an empty 304 Not Modified instead.
+
+    Bodies over COMPRESS_MIN_SIZE are gzipped once when cached, so
+    hits skip both JSON encoding and compression.
+
+    Usage:
+        @cached_response('faculty')
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Versions are read before querying: if a write lands while
+            # the view runs, the entry is stored under the old versions
+            # and never matched again
+            current = dict(get_db_connection().execute(SQL_SELECT_TABLE_VERSIONS).fetchall())
+            versions = tuple(current[table] for table in tables)
+            key = (request.path, request.query_string, versions)
+            now = time.monotonic()
+            with _cache_lock:
+                entry = _cache.get(key)
+                if entry is not None:
+                    _cache.move_to_end(key)
+            if entry is None or now - entry[0] >= _CACHE_TTL:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+                body = response.get_data()
+                gzip_body = None
+                if len(body) >= app.config['COMPRESS_MIN_SIZE']:
+                    gzip_body = gzip.compress(body, app.config['COMPRESS_LEVEL'], mtime=0)
+                entry = (now, body, gzip_body, hashlib.sha1(body).hexdigest())
+                with _cache_lock:
+                    _cache[key] = entry
+                    _cache.move_to_end(key)
+                    while len(_cache) > _CACHE_MAX_ENTRIES:
+                        _cache.popitem(last=False)
+
+            _, body, gzip_body, etag = entry
+            response = app.response_class(body, mimetype='application/json')
+            if gzip_body is not None and 'gzip' in request.accept_encodings:
+                # Flask-Compress leaves responses that already have an encoding alone
+                response.set_data(gzip_body)
+                response.headers['Content-Encoding'] = 'gzip'
+                etag += ':gzip'
+            response.set_etag(etag)
+            response.headers['Vary'] = 'Accept-Encoding'
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+@app.after_request
+def set_cache_control(response):
+    """Add the endpoint's Cache-Control header to successful responses."""
+    cache_control = CACHE_CONTROL.get(request.endpoint)
+    if cache_control is not None and response.status_code in (200, 304):
+        response.headers['Cache-Control'] = cache_control
+    return response
+
+
+def rows_to_dicts(rows, *bool_fields):
+    """
+    Convert sqlite3.Row objects to plain dictionaries.
+    Queries alias their columns to the camelCase API names, so only the
+    0/1 flag columns listed in bool_fields need converting to booleans.
+
+    Pass the cursor itself rather than cursor.fetchall(): rows are then
+    converted one at a time as SQLite steps through the result, instead
+    of holding every Row and every dict in memory at once.
+    """
+    result = []
+    for row in rows:
+        item = dict(row)
+        for field in bool_fields:
+            item[field] = bool(item[field])
+        result.append(item)
+    return result
+
+
+# ========================================
+# Contact Form Write Queue
+# ========================================
+
+def _contact_writer():
+    """
+    Background thread: write queued contact messages in batches.
+    Everything queued while the previous batch was committing goes
+    into the next executemany(), so a burst shares a single commit.
+    """
+    conn = _connect()
+    while True:
+        rows = [_contact_queue.get()]
+        while len(rows) < _CONTACT_BATCH_SIZE:
+            try:
+                rows.append(_contact_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with conn:
+                conn.executemany(SQL_INSERT_CONTACT, rows)
+        except Exception:
+            # One bad row fails the whole executemany(); retry one by
+            # one so only that row is lost. Catch everything: an
+            # exception escaping here would kill the writer thread
+            logger.warning('Batch of %d contact message(s) failed, retrying '
+                           'one at a time', len(rows), exc_info=True)
+            for row in rows:
+                try:
+                    with conn:
+                        conn.execute(SQL_INSERT_CONTACT, row)
+                except Exception:
+                    logger.exception('Failed to save contact message from %r', row[2])
+        finally:
+            for _ in rows:
+                _contact_queue.task_done()
+
+
+def enqueue_contact(row):
+    """
+    Queue a contact_messages row for the background writer, starting
+    the writer thread if it is not running in this process (on first
+    use, after the fork into a gunicorn worker, which threads do not
+    survive, or if it ever died).
+    """
+    global _contact_writer_thread
+    if _contact_writer_thread is None or not _contact_writer_thread.is_alive():
+        with _contact_writer_lock:
+            if _contact_writer_thread is None or not _contact_writer_thread.is_alive():
+                _contact_writer_thread = threading.Thread(target=_contact_writer, daemon=True)
+                _contact_writer_thread.start()
+    _contact_queue.put(row)
+
+
+@atexit.register
+def _flush_contact_queue(timeout=5):
+    """Give the writer a few seconds to save queued messages on shutdown."""
+    with _contact_queue.all_tasks_done:
+        _contact_queue.all_tasks_done.wait_for(
+            lambda: not _contact_queue.unfinished_tasks, timeout)
+
+
+# ========================================
+# Request Validation Helpers
+# ========================================
+
+def check_fields(data, fields, optional=()):
+    """
+    Return the error for the first invalid field of a JSON object, or
+    None. Required fields must be non-empty strings; optional fields
+    may be absent or null but otherwise must be strings too, so values
+    SQLite cannot bind (objects, lists, huge integers) never reach it.
+    """
+    for field in fields:
+        value = data.get(field)
+        if not value:
+            return f'{field} is required'
+        if not isinstance(value, str):
+            return f'{field} must be a string'
+    for field in optional:
+        if data.get(field) is not None and not isinstance(data[field], str):
+            return f'{field} must be a string'
+    return None
+
+
+def require_fields(*fields, optional=()):
+    """
+    Reject the request with 400 unless the JSON body is an object with
+    every listed field as a non-empty string, and every optional field
+    either absent or a string (see check_fields).
+
+    Usage:
+        @require_fields('name', 'designation', 'subject', optional=('bio', 'email'))
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return jsonify({
+                    'success': False,
+                    'error': 'Request body must be a JSON object'
+                }), 400
+            error = check_fields(data, fields, optional)
+            if error:
+                return jsonify({
+                    'success': False,
+                    'error': error
+                }), 400
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Largest number of rows accepted by one bulk POST
+BULK_MAX_ITEMS = 1000
+
+
+def require_bulk_items(*fields, optional=()):
+    """
+    Reject a bulk request with 400 unless the JSON body has an "items"
+    list of 1..BULK_MAX_ITEMS objects, each passing check_fields.
+
+    Usage:
+        @require_bulk_items('title', 'description')
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            data = request.get_json(silent=True)
+            items = data.get('items') if isinstance(data, dict) else None
+            if not isinstance(data, dict):
+                error = 'Request body must be a JSON object'
+            elif not isinstance(items, list) or not items:
+                error = 'items must be a non-empty list'
+            elif len(items) > BULK_MAX_ITEMS:
+                error = f'items may contain at most {BULK_MAX_ITEMS} entries'
+            else:
+                error = None
+                for index, item in enumerate(items):
+                    if not isinstance(item, dict):
+                        error = f'items[{index}] must be an object'
+                        break
+                    error = check_fields(item, fields, optional)
+                    if error:
+                        error = f'items[{index}].{error}'
+                        break
+            if error:
+                return jsonify({'success': False, 'error': error}), 400
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Gallery rows hold a link to the image, never the image itself
+IMAGE_URL_MAX_LENGTH = 2048
+
+
+def is_image_url(value):
+    """
+    True if value is an http(s) link of reasonable length.
+    Rejects data: URIs and other inline images, which would put the
+    image bytes into every gallery list response.
+    """
+    if not isinstance(value, str) or len(value) > IMAGE_URL_MAX_LENGTH:
+        return False
+    parts = urlsplit(value)
+    return parts.scheme in ('http', 'https') and bool(parts.netloc)
+
+
+# ========================================
+# Pagination Helpers
+# ========================================
+
+def encode_cursor(item):
+    """Opaque ?cursor= value for the page that starts after item."""
+    key = orjson.dumps([item['createdAt'], item['id']])
+    return base64.urlsafe_b64encode(key).decode()
+
+
+def decode_cursor(value):
+    """
+    Turn a cursor back into its (created_at, id) key.
+    Raises ValueError if it was not produced by encode_cursor().
+    """
+    try:
+        created_at, row_id = orjson.loads(base64.urlsafe_b64decode(value))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(created_at, str) or not isinstance(row_id, int) \
+            or not 0 <= row_id < 2 ** 63:
+        raise ValueError('Invalid cursor')
+    return created_at, row_id
+
+
+def list_response(conn, sql_full, sql_page, *bool_fields):
+    """
+    Run a list query, newest first, and build its JSON response.
+
+    Without ?limit= or ?cursor= the whole list is returned. With them,
+    one page of up to `limit` rows (default LIST_PAGE_SIZE, max
+    LIST_MAX_PAGE_SIZE) is returned along with nextCursor, the ?cursor=
+    for the following page (null on the last one). Pages continue from
+    the (created_at, id) of the previous page's last row, so deep pages
+    are as cheap as the first and new rows don't shift them.
+    """
+    if 'limit' not in request.args and 'cursor' not in request.args:
+        result = rows_to_dicts(conn.execute(sql_full), *bool_fields)
+        return jsonify({
+            'success': True,
+            'data': result,
+            'count': len(result)
+        }), 200
+
+    limit = request.args.get('limit', LIST_PAGE_SIZE, type=int)
+    limit = min(max(limit, 1), LIST_MAX_PAGE_SIZE)
+    created_at, row_id = _FIRST_PAGE_KEY
+    if 'cursor' in request.args:
+        try:
+            created_at, row_id = decode_cursor(request.args['cursor'])
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+    # Fetch one extra row to find out whether another page exists
+    rows = conn.execute(sql_page, (created_at, created_at, row_id, limit + 1))
+    result = rows_to_dicts(rows, *bool_fields)
+    next_cursor = encode_cursor(result[limit - 1]) if len(result) > limit else None
+    result = result[:limit]
+
+    return jsonify({
+        'success': True,
+        'data': result,
+        'count': len(result),
+        'nextCursor': next_cursor
+    }), 200
+
+
+# ========================================
+# Insert Row Builders
+# ========================================
+# Map a JSON object to the parameter tuple of its INSERT statement, shared
+# by the single-row and bulk POST routes
+
+def faculty_row(data):
+    return (
+        data['name'],
+        data['designation'],
+        data['subject'],
+        data.get('bio', ''),
+        data.get('email', ''),
+        1 if data.get('isHod') else 0
+    )
+
+
+def achievement_row(data):
+    return (
+        data.get('icon', '🏆'),
+        data['title'],
+        data['description'],
+        data.get('category', 'general'),
+        1 if data.get('isActive', True) else 0
+    )
+
+
+def gallery_row(data):
+    return (
+        data['imageUrl'],
+        data['caption'],
+        data.get('eventDate', ''),
+        1 if data.get('isActive', True) else 0
+    )
+
+
+def _seed_if_empty(cursor, table, columns, rows):
+    """
+    Insert rows into table only if the table has no rows yet.
+    Uses one INSERT ... SELECT ... WHERE NOT EXISTS statement, so the
+    emptiness check and the insert happen together in SQLite.
+    Returns True if the rows were inserted.
+    """
+    row_placeholders = '(' + ', '.join('?' * len(columns)) + ')'
+    cursor.execute(f'''
+        INSERT INTO {table} ({', '.join(columns)})
+        SELECT * FROM (VALUES {', '.join([row_placeholders] * len(rows))})
+        WHERE NOT EXISTS (SELECT 1 FROM {table})
+    ''', [value for row in rows for value in row])
+    return cursor.rowcount > 0
+
+
 def init_db():
     """
     Initialize the database with required tables.
     Creates tables if they don't exist.
     """
-    conn = get_db_connection()
+    conn = _connect()
     cursor = conn.cursor()
+
+    # WAL lets readers run while a write is in progress. The mode is
+    # stored in the database file, so every later connection uses it;
+    # it has to be set outside a transaction
+    cursor.execute('PRAGMA journal_mode = WAL')
+
+    # Run the whole initializer as one write transaction: the schema and
+    # seed data hit disk with a single commit, and concurrently starting
+    # workers wait here instead of seeding the same tables twice
+    cursor.execute('BEGIN IMMEDIATE')
     
     # ----------------------------------------
     # Create Contact Messages Table
@@ -113,99 +833,161 @@ def init_db():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
+
+    # ----------------------------------------
+    # Create Indexes
+    # Match the ORDER BY (and is_active filter) of each list endpoint
+    # so SQLite reads rows in order instead of sorting every request
+    # ----------------------------------------
+    # (executed one by one, executescript() would commit the transaction)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_contact_created_id
+            ON contact_messages (created_at DESC, id DESC)
+    ''')
+    # Superseded by idx_contact_created_id (id breaks ties between
+    # messages saved in the same second)
+    cursor.execute('DROP INDEX IF EXISTS idx_contact_created')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_faculty_hod_name
+            ON faculty (is_hod DESC, name ASC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_ach_active_created
+            ON achievements (is_active, created_at DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_gallery_active_created
+            ON gallery (is_active, created_at DESC)
+    ''')
+    # The admin pages list every row (?all=true), ordered by date alone
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_ach_created
+            ON achievements (created_at DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_gallery_created
+            ON gallery (created_at DESC)
+    ''')
+
+    # ----------------------------------------
+    # Create Table Versions
+    # One counter per cached table, bumped by triggers whenever a row
+    # changes; the response cache keys on these (see cached_response)
+    # ----------------------------------------
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    for table in ('faculty', 'achievements', 'gallery'):
+        cursor.execute(
+            'INSERT OR IGNORE INTO table_versions (name) VALUES (?)', (table,)
+        )
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_version
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1
+                    WHERE name = '{table}';
+                END
+            ''')
+
+    # ----------------------------------------
+    # Insert Sample Data
+    # Each table is seeded only while it is still empty
+    # ----------------------------------------
+    sample_gallery = [
+        ('https://images.unsplash.com/photo-1540575467063-178a50c2df87?w=600', 'Annual Tech Fest 2024 - Students showcasing AI projects', '2024-03-15'),
+        ('https://images.unsplash.com/photo-1523580494863-6f3031224c94?w=600', 'Industry Expert Guest Lecture on Machine Learning', '2024-02-20'),
+        ('https://images.unsplash.com/photo-1559223607-a43c990c692c?w=600', 'Hackathon Winners - Smart India Hackathon 2024', '2024-01-10'),
+        ('https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=600', 'Workshop on Deep Learning and Neural Networks', '2024-02-05'),
+        ('https://images.unsplash.com/photo-1531482615713-2afd69097998?w=600', 'Placement Drive - Campus Recruitment 2024', '2024-01-25'),
+        ('https://images.unsplash.com/photo-1552664730-d307ca884978?w=600', 'Faculty Development Program on AI Ethics', '2024-02-28'),
+    ]
+    if _seed_if_empty(cursor, 'gallery', ('image_url', 'caption', 'event_date'), sample_gallery):
+        logger.info('Sample gallery data inserted')
     
-    # Check if gallery table is empty, if so, add sample data
-    cursor.execute('SELECT COUNT(*) FROM gallery')
-    gallery_count = cursor.fetchone()[0]
-    
-    if gallery_count == 0:
-        sample_gallery = [
-            ('https://images.unsplash.com/photo-1540575467063-178a50c2df87?w=600', 'Annual Tech Fest 2024 - Students showcasing AI projects', '2024-03-15'),
-            ('https://images.unsplash.com/photo-1523580494863-6f3031224c94?w=600', 'Industry Expert Guest Lecture on Machine Learning', '2024-02-20'),
-            ('https://images.unsplash.com/photo-1559223607-a43c990c692c?w=600', 'Hackathon Winners - Smart India Hackathon 2024', '2024-01-10'),
-            ('https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=600', 'Workshop on Deep Learning and Neural Networks', '2024-02-05'),
-            ('https://images.unsplash.com/photo-1531482615713-2afd69097998?w=600', 'Placement Drive - Campus Recruitment 2024', '2024-01-25'),
-            ('https://images.unsplash.com/photo-1552664730-d307ca884978?w=600', 'Faculty Development Program on AI Ethics', '2024-02-28'),
-        ]
-        cursor.executemany('''
-            INSERT INTO gallery (image_url, caption, event_date)
-            VALUES (?, ?, ?)
-        ''', sample_gallery)
-        print("✅ Sample gallery data inserted!")
-    
-    # Check if achievements table is empty, if so, add sample data
-    cursor.execute('SELECT COUNT(*) FROM achievements')
-    ach_count = cursor.fetchone()[0]
-    
-    if ach_count == 0:
-        sample_achievements = [
-            ('🎯', '100% Placement', 'All eligible students placed in top MNCs for 2024 batch', 'placement', 1),
-            ('💼', 'Top Recruiters', 'Google, Microsoft, Amazon, TCS, Infosys & more visiting campus', 'placement', 1),
-            ('🏆', 'Hackathon Champions', 'Students won Smart India Hackathon 2024', 'competition', 1),
-            ('📚', 'Research Excellence', '50+ papers published in international journals', 'research', 1),
-            ('🌟', 'Industry Projects', 'Live projects with IBM, Intel & Nvidia partnerships', 'project', 1),
-            ('🎓', 'Highest Package', '45 LPA offered by leading tech company', 'placement', 1),
-        ]
-        cursor.executemany('''
-            INSERT INTO achievements (icon, title, description, category, is_active)
-            VALUES (?, ?, ?, ?, ?)
-        ''', sample_achievements)
-        print("✅ Sample achievements data inserted!")
-    
-    # Check if faculty table is empty, if so, add sample data
-    cursor.execute('SELECT COUNT(*) FROM faculty')
-    count = cursor.fetchone()[0]
+    sample_achievements = [
+        ('🎯', '100% Placement', 'All eligible students placed in top MNCs for 2024 batch', 'placement', 1),
+        ('💼', 'Top Recruiters', 'Google, Microsoft, Amazon, TCS, Infosys & more visiting campus', 'placement', 1),
+        ('🏆', 'Hackathon Champions', 'Students won Smart India Hackathon 2024', 'competition', 1),
+        ('📚', 'Research Excellence', '50+ papers published in international journals', 'research', 1),
+        ('🌟', 'Industry Projects', 'Live projects with IBM, Intel & Nvidia partnerships', 'project', 1),
+        ('🎓', 'Highest Package', '45 LPA offered by leading tech company', 'placement', 1),
+    ]
+    if _seed_if_empty(cursor, 'achievements',
+                      ('icon', 'title', 'description', 'category', 'is_active'),
+                      sample_achievements):
+        logger.info('Sample achievements data inserted')
     
-    if count == 0:
-        # Insert sample faculty data
-        sample_faculty = [
-            ('Dr. Rajesh Kumar', 'Head of Department & Professor', 
-             'Deep Learning & Neural Networks',
-             'Dr. Rajesh Kumar has over 20 years of experience in AI research and education.',
-             'rajesh.kumar@college.edu', 1),
-            ('Dr. Priya Sharma', 'Associate Professor',
-             'Machine Learning & Pattern Recognition',
-             'Ph.D. from IISc Bangalore with expertise in ML algorithms.',
-             'priya.sharma@college.edu', 0),
-            ('Dr. Amit Patel', 'Associate Professor',
-             'Natural Language Processing',
-             'Expert in NLP with focus on sentiment analysis and language models.',
-             'amit.patel@college.edu', 0),
-            ('Dr. Sneha Reddy', 'Assistant Professor',
-             'Computer Vision & Image Processing',
-             'Specializes in image recognition and object detection algorithms.',
-             'sneha.reddy@college.edu', 0),
-            ('Dr. Vikram Singh', 'Assistant Professor',
-             'Big Data Analytics',
-             'Expert in distributed computing and large-scale data processing.',
-             'vikram.singh@college.edu', 0),
-            ('Dr. Anita Verma', 'Assistant Professor',
-             'Data Mining & Warehousing',
-             'Focuses on knowledge discovery from large datasets.',
-             'anita.verma@college.edu', 0),
-            ('Prof. Dhanapathy', 'Professor',
-             'Artificial Neural Networks',
-             '30+ years of teaching experience with expertise in neural networks.',
-             'dhanapathy@college.edu', 0),
-            ('Dr. Kavita Nair', 'Associate Professor',
-             'Reinforcement Learning',
-             'Research focuses on RL applications in robotics.',
-             'kavita.nair@college.edu', 0),
-            ('Dr. Rahul Joshi', 'Assistant Professor',
-             'Statistical Learning & Probability',
-             'Expert in probabilistic models and statistical inference.',
-             'rahul.joshi@college.edu', 0),
-        ]
-        
-        cursor.executemany('''
-            INSERT INTO faculty (name, designation, subject, bio, email, is_hod)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', sample_faculty)
-        print("✅ Sample faculty data inserted!")
+    sample_faculty = [
+        ('Dr. Rajesh Kumar', 'Head of Department & Professor', 
+         'Deep Learning & Neural Networks',
+         'Dr. Rajesh Kumar has over 20 years of experience in AI research and education.',
+         'rajesh.kumar@college.edu', 1),
+        ('Dr. Priya Sharma', 'Associate Professor',
+         'Machine Learning & Pattern Recognition',
+         'Ph.D. from IISc Bangalore with expertise in ML algorithms.',
+         'priya.sharma@college.edu', 0),
+        ('Dr. Amit Patel', 'Associate Professor',
+         'Natural Language Processing',
+         'Expert in NLP with focus on sentiment analysis and language models.',
+         'amit.patel@college.edu', 0),
+        ('Dr. Sneha Reddy', 'Assistant Professor',
+         'Computer Vision & Image Processing',
+         'Specializes in image recognition and object detection algorithms.',
+         'sneha.reddy@college.edu', 0),
+        ('Dr. Vikram Singh', 'Assistant Professor',
+         'Big Data Analytics',
+         'Expert in distributed computing and large-scale data processing.',
+         'vikram.singh@college.edu', 0),
+        ('Dr. Anita Verma', 'Assistant Professor',
+         'Data Mining & Warehousing',
+         'Focuses on knowledge discovery from large datasets.',
+         'anita.verma@college.edu', 0),
+        ('Prof. Dhanapathy', 'Professor',
+         'Artificial Neural Networks',
+         '30+ years of teaching experience with expertise in neural networks.',
+         'dhanapathy@college.edu', 0),
+        ('Dr. Kavita Nair', 'Associate Professor',
+         'Reinforcement Learning',
+         'Research focuses on RL applications in robotics.',
+         'kavita.nair@college.edu', 0),
+        ('Dr. Rahul Joshi', 'Assistant Professor',
+         'Statistical Learning & Probability',
+         'Expert in probabilistic models and statistical inference.',
+         'rahul.joshi@college.edu', 0),
+    ]
+    if _seed_if_empty(cursor, 'faculty',
+                      ('name', 'designation', 'subject', 'bio', 'email', 'is_hod'),
+                      sample_faculty):
+        logger.info('Sample faculty data inserted')
     
     conn.commit()
     conn.close()
-    print("✅ Database initialized successfully!")
+    logger.info('Database initialized')
+
+
+# ========================================
+# Error Handlers
+# ========================================
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """
+    Log unexpected errors and return a generic JSON 500 response.
+    HTTP errors (404, 405, 400 ...) keep their normal response, and
+    exception details are never sent to the client.
+    """
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception(e)
+    return jsonify({
+        'success': False,
+        'error': 'Internal server error'
+    }), 500
 
 
 # ========================================
@@ -215,29 +997,99 @@ def init_db():
 # ----------------------------------------
 # Route: Serve Static Files (Frontend)
 # ----------------------------------------
+# Browsers may reuse static files for this long before revalidating;
+# unchanged files then come back as 304 Not Modified
+STATIC_MAX_AGE = 3600  # seconds
+
+# Only frontend assets are served; app.py, department.db and the
+# deployment configs live in the same directory and must stay private
+STATIC_EXTENSIONS = {'.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp'}
+
+# Text assets worth gzipping; images are already compressed
+STATIC_COMPRESSIBLE = {'.html', '.css', '.js', '.svg'}
+
+# Gzipped text assets: path -> (file mtime, gzipped body, ETag)
+_static_gzip = {}
+
+
+def send_static(filename):
+    """
+    Send a frontend file with conditional GET and Cache-Control.
+
+    Flask-Compress skips file responses (they are streamed), so text
+    assets are gzipped here instead, once per file version, for clients
+    that accept gzip. The gzipped variant gets its own ETag.
+    """
+    path = safe_join('.', filename)
+    ext = os.path.splitext(filename)[1].lower()
+    if (path is None or ext not in STATIC_COMPRESSIBLE
+            or 'gzip' not in request.accept_encodings or not os.path.isfile(path)):
+        return send_from_directory('.', filename, conditional=True, max_age=STATIC_MAX_AGE)
+
+    mtime = os.path.getmtime(path)
+    entry = _static_gzip.get(path)
+    if entry is None or entry[0] != mtime:
+        with open(path, 'rb') as f:
+            body = f.read()
+        entry = (
+            mtime,
+            gzip.compress(body, app.config['COMPRESS_LEVEL'], mtime=0),
+            hashlib.sha1(body).hexdigest() + ':gzip'
+        )
+        _static_gzip[path] = entry
+
+    _, gzip_body, etag = entry
+    response = app.response_class(gzip_body, mimetype=mimetypes.guess_type(filename)[0])
+    # Flask-Compress leaves responses that already have an encoding alone
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(etag)
+    response.last_modified = mtime
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    response.expires = time.time() + STATIC_MAX_AGE
+    return response.make_conditional(request)
+
+
 @app.route('/')
 def serve_index():
     """Serve the main index.html file"""
-    return send_from_directory('.', 'index.html')
+    return send_static('index.html')
 
 
 @app.route('/<path:filename>')
 def serve_static(filename):
-    """Serve any static file (HTML, CSS, JS)"""
-    return send_from_directory('.', filename)
+    """Serve a frontend file (HTML, CSS, JS, images)"""
+    if os.path.splitext(filename)[1].lower() not in STATIC_EXTENSIONS:
+        abort(404)
+    return send_static(filename)
 
 
 # ----------------------------------------
 # Route: Admin Login
 # POST /api/login
 # ----------------------------------------
-# Admin credentials (In production, use environment variables and hashed passwords)
-ADMIN_CREDENTIALS = {
-    'admin': 'smvec2024',
-    'staff': 'aidsstaff123'
+# Admin credentials, stored as salted PBKDF2 hashes
+# (generate new ones with werkzeug.security.generate_password_hash)
+ADMIN_PASSWORD_HASHES = {
+    'admin': 'pbkdf2:sha256:260000$4rFJQB2LHK0LXi3V$947209cd7f92ec93785ef0b7794c3d55c3c2e6c494f2b7bb922ee4ca572c9575',
+    'staff': 'pbkdf2:sha256:260000$SX1BmeReC6yKVnWj$c3dd5d248c91c2eb245a463c0a96736080cd563618f18b009b110cb64e0dbafb'
 }
 
+# Checked for unknown usernames so every failed login costs the same time
+_DUMMY_PASSWORD_HASH = ADMIN_PASSWORD_HASHES['admin']
+
+@app.errorhandler(429)
+def rate_limit_exceeded(e):
+    """Return rate limit errors as JSON like the rest of the API."""
+    return jsonify({
+        'success': False,
+        'error': 'Too many requests, please try again later'
+    }), 429
+
+
 @app.route('/api/login', methods=['POST'])
+@limiter.limit('10 per minute')
 def admin_login():
     """
     Authenticate admin/staff login.
@@ -245,31 +1097,28 @@ def admin_login():
     Expected JSON body:
     {
         "username": "admin",
-        "password": "smvec2024"
+        "password": "********"
     }
     """
-    try:
-        data = request.get_json()
-        username = data.get('username', '').strip().lower()
-        password = data.get('password', '')
-        
-        if username in ADMIN_CREDENTIALS and ADMIN_CREDENTIALS[username] == password:
-            return jsonify({
-                'success': True,
-                'message': 'Login successful',
-                'user': username
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid username or password'
-            }), 401
-            
-    except Exception as e:
+    data = request.get_json()
+    username = data.get('username', '').strip().lower()
+    password = data.get('password', '')
+
+    # check_password_hash compares digests in constant time
+    stored_hash = ADMIN_PASSWORD_HASHES.get(username)
+    if stored_hash is None:
+        check_password_hash(_DUMMY_PASSWORD_HASH, password)
+    elif check_password_hash(stored_hash, password):
         return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+            'success': True,
+            'message': 'Login successful',
+            'user': username
+        }), 200
+
+    return jsonify({
+        'success': False,
+        'error': 'Invalid username or password'
+    }), 401
 
 
 # ----------------------------------------
@@ -277,9 +1126,13 @@ def admin_login():
 # POST /api/contact
 # ----------------------------------------
 @app.route('/api/contact', methods=['POST'])
+@limiter.limit('5 per minute')  # Rejected before validation or any DB work
+@require_fields('firstName', 'lastName', 'email', 'subject', 'message', optional=('phone',))
 def submit_contact():
     """
-    Receive contact form data and store in database.
+    Receive contact form data and queue it for storage.
+    The message is saved by the background writer, so the response
+    is 202 Accepted and does not include the new row id.
     
     Expected JSON body:
     {
@@ -292,55 +1145,25 @@ def submit_contact():
         "newsletter": true
     }
     """
-    try:
-        # Get JSON data from request
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['firstName', 'lastName', 'email', 'subject', 'message']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({
-                    'success': False,
-                    'error': f'{field} is required'
-                }), 400
-        
-        # Connect to database
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Insert contact message
-        cursor.execute('''
-            INSERT INTO contact_messages 
-            (first_name, last_name, email, phone, subject, message, newsletter)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data['firstName'],
-            data['lastName'],
-            data['email'],
-            data.get('phone', ''),
-            data['subject'],
-            data['message'],
-            1 if data.get('newsletter') else 0
-        ))
-        
-        conn.commit()
-        message_id = cursor.lastrowid
-        conn.close()
-        
-        # Return success response
-        return jsonify({
-            'success': True,
-            'message': 'Your message has been received! We will get back to you soon.',
-            'id': message_id
-        }), 201
-        
-    except Exception as e:
-        # Return error response
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Get JSON data from request (required fields already validated)
+    data = request.get_json()
+
+    # Queue contact message for the background writer
+    enqueue_contact((
+        data['firstName'],
+        data['lastName'],
+        data['email'],
+        data.get('phone', ''),
+        data['subject'],
+        data['message'],
+        1 if data.get('newsletter') else 0
+    ))
+
+    # Return success response
+    return jsonify({
+        'success': True,
+        'message': 'Your message has been received! We will get back to you soon.'
+    }), 202
 
 
 # ----------------------------------------
@@ -350,43 +1173,75 @@ def submit_contact():
 @app.route('/api/contact', methods=['GET'])
 def get_contacts():
     """
-    Fetch all contact messages from database.
-    Returns list of all submitted contact forms.
+    Fetch one page of contact messages, newest first.
+    
+    Query parameters:
+        page - zero-based page number (default 0, max 1000000)
+        size - messages per page (default 50, max 500)
+    """
+    page = min(max(request.args.get('page', 0, type=int), 0), CONTACT_MAX_PAGE)
+    size = request.args.get('size', CONTACT_PAGE_SIZE, type=int)
+    size = min(max(size, 1), CONTACT_MAX_PAGE_SIZE)
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    # Fetch one extra row to find out whether another page exists
+    cursor.execute(SQL_SELECT_CONTACTS, (size + 1, page * size))
+
+    # Convert rows to list of dictionaries
+    result = rows_to_dicts(cursor, 'newsletter')
+    has_more = len(result) > size
+    result = result[:size]
+
+    return jsonify({
+        'success': True,
+        'data': result,
+        'count': len(result),
+        'page': page,
+        'size': size,
+        'hasMore': has_more
+    }), 200
+
+
+# ----------------------------------------
+# Route: Get Contact Message Statistics
+# GET /api/contact/stats
+# ----------------------------------------
+@app.route('/api/contact/stats', methods=['GET'])
+def get_contact_stats():
+    """
+    Count contact messages for the admin dashboard in one query, so
+    the inbox does not have to download every message to show totals.
+
+    Query parameters:
+        since - start of "today" as an ISO datetime (the browser's local
+                midnight); defaults to midnight UTC
     """
+    since = request.args.get('since')
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM contact_messages ORDER BY created_at DESC')
-        messages = cursor.fetchall()
-        conn.close()
-        
-        # Convert rows to list of dictionaries
-        result = []
-        for msg in messages:
-            result.append({
-                'id': msg['id'],
-                'firstName': msg['first_name'],
-                'lastName': msg['last_name'],
-                'email': msg['email'],
-                'phone': msg['phone'],
-                'subject': msg['subject'],
-                'message': msg['message'],
-                'newsletter': bool(msg['newsletter']),
-                'createdAt': msg['created_at']
-            })
-        
-        return jsonify({
-            'success': True,
-            'data': result,
-            'count': len(result)
-        }), 200
-        
-    except Exception as e:
+        since = datetime.fromisoformat(since.replace('Z', '+00:00')) if since else None
+    except ValueError:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': 'since must be an ISO datetime'
+        }), 400
+    if since is None:
+        since = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    elif since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    # created_at is stored as UTC 'YYYY-MM-DD HH:MM:SS' text
+    since = since.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    stats = get_db_connection().execute(SQL_CONTACT_STATS, (since,)).fetchone()
+
+    return jsonify({
+        'success': True,
+        'total': stats['total'],
+        'today': stats['today'],
+        'admission': stats['admission'],
+        'other': stats['total'] - stats['admission']
+    }), 200
 
 
 # ----------------------------------------
@@ -394,44 +1249,26 @@ def get_contacts():
 # GET /api/faculty
 # ----------------------------------------
 @app.route('/api/faculty', methods=['GET'])
+@cached_response('faculty')
 def get_faculty():
     """
     Fetch all faculty members from database.
     Returns list of faculty with their details.
     """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get all faculty, HOD first
-        cursor.execute('SELECT * FROM faculty ORDER BY is_hod DESC, name ASC')
-        faculty = cursor.fetchall()
-        conn.close()
-        
-        # Convert rows to list of dictionaries
-        result = []
-        for member in faculty:
-            result.append({
-                'id': member['id'],
-                'name': member['name'],
-                'designation': member['designation'],
-                'subject': member['subject'],
-                'bio': member['bio'],
-                'email': member['email'],
-                'isHod': bool(member['is_hod'])
-            })
-        
-        return jsonify({
-            'success': True,
-            'data': result,
-            'count': len(result)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    # Get all faculty, HOD first
+    cursor.execute(SQL_SELECT_FACULTY)
+
+    # Convert rows to list of dictionaries
+    result = rows_to_dicts(cursor, 'isHod')
+
+    return jsonify({
+        'success': True,
+        'data': result,
+        'count': len(result)
+    }), 200
 
 
 # ----------------------------------------
@@ -439,42 +1276,27 @@ def get_faculty():
 # GET /api/faculty/<id>
 # ----------------------------------------
 @app.route('/api/faculty/<int:faculty_id>', methods=['GET'])
+@cached_response('faculty')
 def get_faculty_by_id(faculty_id):
     """
     Fetch a single faculty member by ID.
     """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM faculty WHERE id = ?', (faculty_id,))
-        member = cursor.fetchone()
-        conn.close()
-        
-        if member is None:
-            return jsonify({
-                'success': False,
-                'error': 'Faculty member not found'
-            }), 404
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'id': member['id'],
-                'name': member['name'],
-                'designation': member['designation'],
-                'subject': member['subject'],
-                'bio': member['bio'],
-                'email': member['email'],
-                'isHod': bool(member['is_hod'])
-            }
-        }), 200
-        
-    except Exception as e:
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(SQL_SELECT_FACULTY_BY_ID, (faculty_id,))
+    member = cursor.fetchone()
+
+    if member is None:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': 'Faculty member not found'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'data': rows_to_dicts([member], 'isHod')[0]
+    }), 200
 
 
 # ----------------------------------------
@@ -482,6 +1304,7 @@ def get_faculty_by_id(faculty_id):
 # POST /api/faculty
 # ----------------------------------------
 @app.route('/api/faculty', methods=['POST'])
+@require_fields('name', 'designation', 'subject', optional=('bio', 'email'))
 def add_faculty():
     """
     Add a new faculty member to database.
@@ -496,48 +1319,49 @@ def add_faculty():
         "isHod": false
     }
     """
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['name', 'designation', 'subject']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({
-                    'success': False,
-                    'error': f'{field} is required'
-                }), 400
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO faculty (name, designation, subject, bio, email, is_hod)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            data['name'],
-            data['designation'],
-            data['subject'],
-            data.get('bio', ''),
-            data.get('email', ''),
-            1 if data.get('isHod') else 0
-        ))
-        
-        conn.commit()
-        faculty_id = cursor.lastrowid
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Faculty member added successfully!',
-            'id': faculty_id
-        }), 201
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    data = request.get_json()
+
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        cursor = conn.execute(SQL_INSERT_FACULTY, faculty_row(data))
+    faculty_id = cursor.lastrowid
+
+    return jsonify({
+        'success': True,
+        'message': 'Faculty member added successfully!',
+        'id': faculty_id
+    }), 201
+
+
+# ----------------------------------------
+# Route: Add Faculty Members in Bulk
+# POST /api/faculty/bulk
+# ----------------------------------------
+@app.route('/api/faculty/bulk', methods=['POST'])
+@require_bulk_items('name', 'designation', 'subject', optional=('bio', 'email'))
+def add_faculty_bulk():
+    """
+    Add many faculty members in one transaction.
+
+    Expected JSON body:
+    {
+        "items": [
+            {"name": "Dr. New Faculty", "designation": "...", "subject": "..."},
+            ...
+        ]
+    }
+    """
+    items = request.get_json()['items']
+
+    # One executemany and one commit for the whole batch
+    with get_db_connection() as conn:
+        conn.executemany(SQL_INSERT_FACULTY, [faculty_row(item) for item in items])
+
+    return jsonify({
+        'success': True,
+        'message': f'{len(items)} faculty members added successfully!',
+        'count': len(items)
+    }), 201
 
 
 # ----------------------------------------
@@ -545,19 +1369,14 @@ def add_faculty():
 # PUT /api/faculty/<id>
 # ----------------------------------------
 @app.route('/api/faculty/<int:faculty_id>', methods=['PUT'])
+@require_fields(optional=('name', 'designation', 'subject', 'bio', 'email'))
 def update_faculty(faculty_id):
     """Update an existing faculty member."""
-    try:
-        data = request.get_json()
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE faculty SET 
-                name = ?, designation = ?, subject = ?, bio = ?, email = ?, is_hod = ?
-            WHERE id = ?
-        ''', (
+    data = request.get_json()
+
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        conn.execute(SQL_UPDATE_FACULTY, (
             data.get('name'),
             data.get('designation'),
             data.get('subject'),
@@ -566,20 +1385,11 @@ def update_faculty(faculty_id):
             1 if data.get('isHod') else 0,
             faculty_id
         ))
-        
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Faculty member updated successfully!'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+
+    return jsonify({
+        'success': True,
+        'message': 'Faculty member updated successfully!'
+    }), 200
 
 
 # ----------------------------------------
@@ -589,24 +1399,14 @@ def update_faculty(faculty_id):
 @app.route('/api/faculty/<int:faculty_id>', methods=['DELETE'])
 def delete_faculty(faculty_id):
     """Delete a faculty member."""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM faculty WHERE id = ?', (faculty_id,))
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Faculty member deleted successfully!'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        conn.execute(SQL_DELETE_FACULTY, (faculty_id,))
+
+    return jsonify({
+        'success': True,
+        'message': 'Faculty member deleted successfully!'
+    }), 200
 
 
 # ----------------------------------------
@@ -614,46 +1414,26 @@ def delete_faculty(faculty_id):
 # GET /api/achievements
 # ----------------------------------------
 @app.route('/api/achievements', methods=['GET'])
+@cached_response('achievements')
 def get_achievements():
-    """Fetch all achievements for the ticker."""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get active achievements by default, or all if ?all=true
-        show_all = request.args.get('all', 'false').lower() == 'true'
-        
-        if show_all:
-            cursor.execute('SELECT * FROM achievements ORDER BY created_at DESC')
-        else:
-            cursor.execute('SELECT * FROM achievements WHERE is_active = 1 ORDER BY created_at DESC')
-        
-        achievements = cursor.fetchall()
-        conn.close()
-        
-        result = []
-        for ach in achievements:
-            result.append({
-                'id': ach['id'],
-                'icon': ach['icon'],
-                'title': ach['title'],
-                'description': ach['description'],
-                'category': ach['category'],
-                'isActive': bool(ach['is_active']),
-                'createdAt': ach['created_at']
-            })
-        
-        return jsonify({
-            'success': True,
-            'data': result,
-            'count': len(result)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    """
+    Fetch achievements for the ticker, newest first.
+
+    Query parameters:
+        all    - "true" to include inactive achievements
+        limit  - page size; paginates the list (see list_response)
+        cursor - nextCursor of the previous page
+    """
+    conn = get_db_connection()
+
+    # Get active achievements by default, or all if ?all=true
+    show_all = request.args.get('all', 'false').lower() == 'true'
+
+    if show_all:
+        return list_response(conn, SQL_SELECT_ALL_ACHIEVEMENTS,
+                             SQL_SELECT_ALL_ACHIEVEMENTS_PAGE, 'isActive')
+    return list_response(conn, SQL_SELECT_ACTIVE_ACHIEVEMENTS,
+                         SQL_SELECT_ACTIVE_ACHIEVEMENTS_PAGE, 'isActive')
 
 
 # ----------------------------------------
@@ -661,46 +1441,52 @@ def get_achievements():
 # POST /api/achievements
 # ----------------------------------------
 @app.route('/api/achievements', methods=['POST'])
+@require_fields('title', 'description', optional=('icon', 'category'))
 def add_achievement():
     """Add a new achievement to the ticker."""
-    try:
-        data = request.get_json()
-        
-        if not data.get('title') or not data.get('description'):
-            return jsonify({
-                'success': False,
-                'error': 'Title and description are required'
-            }), 400
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO achievements (icon, title, description, category, is_active)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            data.get('icon', '🏆'),
-            data['title'],
-            data['description'],
-            data.get('category', 'general'),
-            1 if data.get('isActive', True) else 0
-        ))
-        
-        conn.commit()
-        ach_id = cursor.lastrowid
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Achievement added successfully!',
-            'id': ach_id
-        }), 201
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    data = request.get_json()
+
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        cursor = conn.execute(SQL_INSERT_ACHIEVEMENT, achievement_row(data))
+    ach_id = cursor.lastrowid
+
+    return jsonify({
+        'success': True,
+        'message': 'Achievement added successfully!',
+        'id': ach_id
+    }), 201
+
+
+# ----------------------------------------
+# Route: Add Achievements in Bulk
+# POST /api/achievements/bulk
+# ----------------------------------------
+@app.route('/api/achievements/bulk', methods=['POST'])
+@require_bulk_items('title', 'description', optional=('icon', 'category'))
+def add_achievements_bulk():
+    """
+    Add many achievements in one transaction.
+
+    Expected JSON body:
+    {
+        "items": [
+            {"title": "...", "description": "...", "category": "research"},
+            ...
+        ]
+    }
+    """
+    items = request.get_json()['items']
+
+    # One executemany and one commit for the whole batch
+    with get_db_connection() as conn:
+        conn.executemany(SQL_INSERT_ACHIEVEMENT, [achievement_row(item) for item in items])
+
+    return jsonify({
+        'success': True,
+        'message': f'{len(items)} achievements added successfully!',
+        'count': len(items)
+    }), 201
 
 
 # ----------------------------------------
@@ -708,19 +1494,14 @@ def add_achievement():
 # PUT /api/achievements/<id>
 # ----------------------------------------
 @app.route('/api/achievements/<int:ach_id>', methods=['PUT'])
+@require_fields(optional=('icon', 'title', 'description', 'category'))
 def update_achievement(ach_id):
     """Update an existing achievement."""
-    try:
-        data = request.get_json()
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE achievements SET 
-                icon = ?, title = ?, description = ?, category = ?, is_active = ?
-            WHERE id = ?
-        ''', (
+    data = request.get_json()
+
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        conn.execute(SQL_UPDATE_ACHIEVEMENT, (
             data.get('icon', '🏆'),
             data.get('title'),
             data.get('description'),
@@ -728,20 +1509,11 @@ def update_achievement(ach_id):
             1 if data.get('isActive', True) else 0,
             ach_id
         ))
-        
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Achievement updated successfully!'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+
+    return jsonify({
+        'success': True,
+        'message': 'Achievement updated successfully!'
+    }), 200
 
 
 # ----------------------------------------
@@ -751,24 +1523,14 @@ def update_achievement(ach_id):
 @app.route('/api/achievements/<int:ach_id>', methods=['DELETE'])
 def delete_achievement(ach_id):
     """Delete an achievement."""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM achievements WHERE id = ?', (ach_id,))
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Achievement deleted successfully!'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        conn.execute(SQL_DELETE_ACHIEVEMENT, (ach_id,))
+
+    return jsonify({
+        'success': True,
+        'message': 'Achievement deleted successfully!'
+    }), 200
 
 
 # ----------------------------------------
@@ -776,44 +1538,25 @@ def delete_achievement(ach_id):
 # GET /api/gallery
 # ----------------------------------------
 @app.route('/api/gallery', methods=['GET'])
+@cached_response('gallery')
 def get_gallery():
-    """Fetch all gallery images."""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        show_all = request.args.get('all', 'false').lower() == 'true'
-        
-        if show_all:
-            cursor.execute('SELECT * FROM gallery ORDER BY created_at DESC')
-        else:
-            cursor.execute('SELECT * FROM gallery WHERE is_active = 1 ORDER BY created_at DESC')
-        
-        images = cursor.fetchall()
-        conn.close()
-        
-        result = []
-        for img in images:
-            result.append({
-                'id': img['id'],
-                'imageUrl': img['image_url'],
-                'caption': img['caption'],
-                'eventDate': img['event_date'],
-                'isActive': bool(img['is_active']),
-                'createdAt': img['created_at']
-            })
-        
-        return jsonify({
-            'success': True,
-            'data': result,
-            'count': len(result)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    """
+    Fetch gallery images, newest first.
+
+    Query parameters:
+        all    - "true" to include inactive images
+        limit  - page size; paginates the list (see list_response)
+        cursor - nextCursor of the previous page
+    """
+    conn = get_db_connection()
+
+    show_all = request.args.get('all', 'false').lower() == 'true'
+
+    if show_all:
+        return list_response(conn, SQL_SELECT_ALL_GALLERY,
+                             SQL_SELECT_ALL_GALLERY_PAGE, 'isActive')
+    return list_response(conn, SQL_SELECT_ACTIVE_GALLERY,
+                         SQL_SELECT_ACTIVE_GALLERY_PAGE, 'isActive')
 
 
 # ----------------------------------------
@@ -821,45 +1564,63 @@ def get_gallery():
 # POST /api/gallery
 # ----------------------------------------
 @app.route('/api/gallery', methods=['POST'])
+@require_fields('imageUrl', 'caption', optional=('eventDate',))
 def add_gallery():
     """Add a new gallery image."""
-    try:
-        data = request.get_json()
-        
-        if not data.get('imageUrl') or not data.get('caption'):
+    data = request.get_json()
+    if not is_image_url(data['imageUrl']):
+        return jsonify({
+            'success': False,
+            'error': 'imageUrl must be an http(s) link to the image'
+        }), 400
+
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        cursor = conn.execute(SQL_INSERT_GALLERY, gallery_row(data))
+    img_id = cursor.lastrowid
+
+    return jsonify({
+        'success': True,
+        'message': 'Gallery image added successfully!',
+        'id': img_id
+    }), 201
+
+
+# ----------------------------------------
+# Route: Add Gallery Images in Bulk
+# POST /api/gallery/bulk
+# ----------------------------------------
+@app.route('/api/gallery/bulk', methods=['POST'])
+@require_bulk_items('imageUrl', 'caption', optional=('eventDate',))
+def add_gallery_bulk():
+    """
+    Add many gallery images in one transaction.
+
+    Expected JSON body:
+    {
+        "items": [
+            {"imageUrl": "https://...", "caption": "...", "eventDate": "2024-01-15"},
+            ...
+        ]
+    }
+    """
+    items = request.get_json()['items']
+    for index, item in enumerate(items):
+        if not is_image_url(item['imageUrl']):
             return jsonify({
                 'success': False,
-                'error': 'Image URL and caption are required'
+                'error': f'items[{index}].imageUrl must be an http(s) link to the image'
             }), 400
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO gallery (image_url, caption, event_date, is_active)
-            VALUES (?, ?, ?, ?)
-        ''', (
-            data['imageUrl'],
-            data['caption'],
-            data.get('eventDate', ''),
-            1 if data.get('isActive', True) else 0
-        ))
-        
-        conn.commit()
-        img_id = cursor.lastrowid
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Gallery image added successfully!',
-            'id': img_id
-        }), 201
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+
+    # One executemany and one commit for the whole batch
+    with get_db_connection() as conn:
+        conn.executemany(SQL_INSERT_GALLERY, [gallery_row(item) for item in items])
+
+    return jsonify({
+        'success': True,
+        'message': f'{len(items)} gallery images added successfully!',
+        'count': len(items)
+    }), 201
 
 
 # ----------------------------------------
@@ -867,39 +1628,30 @@ def add_gallery():
 # PUT /api/gallery/<id>
 # ----------------------------------------
 @app.route('/api/gallery/<int:img_id>', methods=['PUT'])
+@require_fields(optional=('imageUrl', 'caption', 'eventDate'))
 def update_gallery(img_id):
     """Update an existing gallery image."""
-    try:
-        data = request.get_json()
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE gallery SET 
-                image_url = ?, caption = ?, event_date = ?, is_active = ?
-            WHERE id = ?
-        ''', (
+    data = request.get_json()
+    if not is_image_url(data.get('imageUrl')):
+        return jsonify({
+            'success': False,
+            'error': 'imageUrl must be an http(s) link to the image'
+        }), 400
+
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        conn.execute(SQL_UPDATE_GALLERY, (
             data.get('imageUrl'),
             data.get('caption'),
             data.get('eventDate', ''),
             1 if data.get('isActive', True) else 0,
             img_id
         ))
-        
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Gallery image updated successfully!'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+
+    return jsonify({
+        'success': True,
+        'message': 'Gallery image updated successfully!'
+    }), 200
 
 
 # ----------------------------------------
@@ -909,59 +1661,78 @@ def update_gallery(img_id):
 @app.route('/api/gallery/<int:img_id>', methods=['DELETE'])
 def delete_gallery(img_id):
     """Delete a gallery image."""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM gallery WHERE id = ?', (img_id,))
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Gallery image deleted successfully!'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Commits on success, rolls back if the statement fails
+    with get_db_connection() as conn:
+        conn.execute(SQL_DELETE_GALLERY, (img_id,))
+
+    return jsonify({
+        'success': True,
+        'message': 'Gallery image deleted successfully!'
+    }), 200
 
 
 # ========================================
-# Run the Application
+# Startup Banner
 # ========================================
+
+def log_banner(port, host='0.0.0.0'):
+    """
+    Log the list of API endpoints as a single INFO record.
+    Called by the __main__ block below and by gunicorn's on_starting
+    hook (see gunicorn.conf.py), so it is logged once per server.
+    Set LOGLEVEL=WARNING to skip it.
+    """
+    logger.info(
+        "\n📡 API Endpoints Available:\n"
+        "----------------------------------------\n"
+        "GET  /                     → Home page\n"
+        "GET  /api/faculty          → Get all faculty\n"
+        "POST /api/faculty          → Add faculty\n"
+        "POST /api/faculty/bulk     → Add many faculty\n"
+        "PUT  /api/faculty/<id>     → Update faculty\n"
+        "DELETE /api/faculty/<id>   → Delete faculty\n"
+        "GET  /api/achievements     → Get achievements\n"
+        "POST /api/achievements     → Add achievement\n"
+        "POST /api/achievements/bulk→ Add many achievements\n"
+        "PUT  /api/achievements/<id>→ Update achievement\n"
+        "DELETE /api/achievements   → Delete achievement\n"
+        "GET  /api/gallery          → Get gallery images\n"
+        "POST /api/gallery          → Add gallery image\n"
+        "POST /api/gallery/bulk     → Add many gallery images\n"
+        "PUT  /api/gallery/<id>     → Update gallery image\n"
+        "DELETE /api/gallery/<id>   → Delete gallery image\n"
+        "GET  /api/contact          → Get messages\n"
+        "GET  /api/contact/stats    → Message counts\n"
+        "POST /api/contact          → Submit contact\n"
+        "----------------------------------------\n"
+        "🌐 Server running at: http://%s:%s\n"
+        "📁 Serving static files from current directory",
+        host, port
+    )
+
+
 # ========================================
 # Run Database Initialization
 # ========================================
 init_db()
 
+# ========================================
+# Run the Application
+# ========================================
+# `app` is the WSGI entry point for gunicorn (see gunicorn.conf.py);
+# running this file directly starts Flask's development server, which
+# listens on localhost only and enables the debugger only when
+# FLASK_DEBUG=1 (never expose the debugger on a public interface)
 if __name__ == '__main__':
-    print("\n" + "="*50)
-    
-    print("\n📡 API Endpoints Available:")
-    print("-" * 40)
-    print("GET  /                     → Home page")
-    print("GET  /api/faculty          → Get all faculty")
-    print("POST /api/faculty          → Add faculty")
-    print("PUT  /api/faculty/<id>     → Update faculty")
-    print("DELETE /api/faculty/<id>   → Delete faculty")
-    print("GET  /api/achievements     → Get achievements")
-    print("POST /api/achievements     → Add achievement")
-    print("PUT  /api/achievements/<id>→ Update achievement")
-    print("DELETE /api/achievements   → Delete achievement")
-    print("GET  /api/gallery          → Get gallery images")
-    print("POST /api/gallery          → Add gallery image")
-    print("PUT  /api/gallery/<id>     → Update gallery image")
-    print("DELETE /api/gallery/<id>   → Delete gallery image")
-    print("GET  /api/contact          → Get messages")
-    print("POST /api/contact          → Submit contact")
-    print("-" * 40)
-    print(f"\n🌐 Server running at: http://0.0.0.0:{port}")
-    print("📁 Serving static files from current directory")
-    print("\nPress Ctrl+C to stop the server\n")
-    
-    import os
     port = int(os.environ.get('PORT', 5000))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    host = os.environ.get('HOST', '127.0.0.1')
+    log_banner(port, host)
+    logger.warning("Development server only - use gunicorn in production: "
+                   "gunicorn -c gunicorn.conf.py app:app")
+    app.run(
+        debug=os.environ.get('FLASK_DEBUG') == '1',
+        host=host,
+        port=port,
+        threaded=True,
+        use_reloader=False
+    )
@@ -0,0 +1,27 @@
+"""
+==========================================================
+AI & DS Department Website - ASGI Entry Point
+==========================================================
+Serves the Flask app through uvicorn (uvloop event loop and
+httptools HTTP parser) for HTTP/1.1 keep-alive and faster
+socket handling than the development server:
+
+    uvicorn asgi:asgi_app --workers 4 --loop uvloop --http httptools
+
+The Procfile deployment (gunicorn app:app) is unaffected.
+==========================================================
+"""
+
+import os
+
+from a2wsgi import WSGIMiddleware
+
+from app import app, DB_POOL_SIZE  # Importing app also runs init_db()
+
+# Flask is synchronous, so each request runs on a worker thread.
+# (asgiref's WsgiToAsgi would push every request through one shared
+# thread, serializing the whole process.) The thread count caps
+# concurrent requests per uvicorn worker; raise ASGI_THREADS together
+# with DB_POOL_SIZE so every thread can keep a pooled connection
+ASGI_THREADS = int(os.environ.get('ASGI_THREADS', DB_POOL_SIZE))
+asgi_app = WSGIMiddleware(app, workers=ASGI_THREADS)
@@ -0,0 +1,82 @@
+"""
+==========================================================
+AI & DS Department Website - Gunicorn Configuration
+==========================================================
+Loaded automatically when the app is started with:
+    gunicorn app:app
+(see Procfile). Replaces Flask's single-threaded development
+server with one pre-forked worker process per CPU core.
+==========================================================
+"""
+
+import multiprocessing
+import os
+
+# ========================================
+# Server Socket
+# ========================================
+# All interfaces by default, for platforms whose router connects to
+# $PORT (Procfile). Behind nginx set HOST=127.0.0.1: the app trusts one
+# X-Forwarded-For hop for rate limiting, so clients must not be able
+# to reach gunicorn directly and send their own header
+host = os.environ.get('HOST', '0.0.0.0')
+port = os.environ.get('PORT', '5000')
+bind = f"{host}:{port}"
+
+# ========================================
+# Worker Processes
+# ========================================
+# 2 x cores + 1 workers suits the short, SQLite-bound requests;
+# set WEB_CONCURRENCY to override on small instances. With more than
+# one worker, set RATELIMIT_STORAGE_URI (see app.py) so the login and
+# contact rate limits are counted across workers, not per worker
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+# Sync workers by default. GUNICORN_WORKER_CLASS=gevent (after
+# `pip install gevent`) lets each worker hold many slow client
+# connections, but SQLite calls still block the whole worker, and only
+# DB_POOL_SIZE connections are pooled per worker: with more concurrent
+# greenlets than that, the extra ones open and close a fresh connection
+# per request. Prefer sync unless clients are slow rather than queries
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+worker_connections = 1000  # Only used by async worker classes
+
+# Request threads per worker. Behind nginx use
+# GUNICORN_WORKER_CLASS=gthread with GUNICORN_THREADS > 1 (see
+# nginx.conf): unlike sync workers, gthread workers keep connections
+# open between requests, so nginx's upstream keepalive pool is reused.
+# Keep it at or below DB_POOL_SIZE so each thread has a pooled connection
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+
+# Seconds an idle connection stays open for the next request. Only
+# gthread and async workers honour this; sync workers close the
+# connection after every response
+keepalive = 5
+
+# Seconds a worker may spend on one request before it is restarted.
+# The write pool behind nginx (see nginx.conf) runs with a longer
+# GUNICORN_TIMEOUT so large bulk inserts aren't cut off
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+
+# Import app.py (and run init_db()) once in the master before forking;
+# each worker then opens its own SQLite connection on first request
+preload_app = True
+
+
+# ========================================
+# Logging
+# ========================================
+# Access and error logs go to stdout/stderr for the platform's log
+# collector; LOGLEVEL also sets the app's own log level (see app.py)
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOGLEVEL', 'info').lower()
+
+
+# ========================================
+# Server Hooks
+# ========================================
+def on_starting(server):
+    """Log the API endpoint banner once, from the master process."""
+    from app import log_banner
+    log_banner(port, host)